@@ -3,9 +3,16 @@ Lighter exchange client implementation.
 """
 
 import os
+import time
 import asyncio
-import requests
+import tempfile
+import inspect
+import itertools
+import threading
+import weakref
+import aiohttp
 from decimal import Decimal
+from dataclasses import dataclass
 from typing import Dict, Any, List, Optional,Tuple
 
 try:
@@ -13,15 +20,81 @@ try:
 except ImportError:
     lighter = None
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    import json
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 from .base import BaseExchangeClient, OrderResult, OrderInfo, query_retry
 from helpers.logger import TradingLogger
 
+# Seconds to remember a symbol missing from the market list before refetching
+MISSING_SYMBOL_TTL = 60
+
+# On-disk copy of the parsed market list, reused across restarts while fresh
+MARKET_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'lighter', 'markets.json')
+MARKET_CACHE_TTL = 6 * 60 * 60
+
+# Environment variable -> (attribute, cast, default); a None default marks it required
+_ENV_SCHEMA = {
+    'LIGHTER_PRIVATE_KEY': ('private_key', str, None),
+    'LIGHTER_ACCOUNT_INDEX': ('account_index', int, None),
+    'LIGHTER_API_KEY_INDEX': ('api_key_index', int, None),
+    'LIGHTER_BASE_URL': ('base_url', str, 'https://testnet.zklighter.elliot.ai'),
+}
+
+# Maximum number of placed orders whose market_index is remembered
+ORDER_INDEX_LIMIT = 1000
+
+_DEC_ZERO = Decimal('0')
+
+
+def _market_entry(market: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep only the orderBookDetails fields the client uses."""
+    return {
+        "symbol": market.get("symbol"),
+        "market_id": market.get("market_id"),
+        "size_decimals": market.get("size_decimals"),
+        "price_decimals": market.get("price_decimals"),
+    }
+
+
+@dataclass(slots=True)
+class MarketSpec:
+    """Per-market order book index and unit scale factors."""
+    index: int
+    size_scale: int
+    price_scale: int
+
+
 def trim_exception(e: Exception) -> str:
     return str(e).strip().split("\n")[-1]
 
 class LighterClient(BaseExchangeClient):
     """Lighter exchange client implementation."""
 
+    # Read-only API clients shared across instances, keyed by base_url
+    _api_clients: Dict[str, Any] = {}
+    _api_clients_lock = threading.Lock()
+
+    # WebSocket connections shared across instances, keyed by (base_url, account_index)
+    _ws_clients: Dict[Tuple[str, int], Any] = {}
+    _ws_tasks: Dict[Tuple[str, int], asyncio.Task] = {}
+    _ws_order_books: Dict[Tuple[str, int], List[int]] = {}
+    _ws_subscribers: Dict[Tuple[str, int], List['LighterClient']] = {}
+    _ws_locks: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]' = weakref.WeakKeyDictionary()
+
     def __init__(self, config: Dict[str, Any]):
         """Initialize Lighter client."""
         super().__init__(config)
@@ -29,16 +102,9 @@ class LighterClient(BaseExchangeClient):
         if lighter is None:
             raise ImportError("lighter SDK is not installed. Please install with: uv add git+https://github.com/elliottech/lighter-python.git")
 
-        # Lighter credentials from environment
-        self.private_key = os.getenv('LIGHTER_PRIVATE_KEY')
-        self.account_index = int(os.getenv('LIGHTER_ACCOUNT_INDEX', '1'))
-        self.api_key_index = int(os.getenv('LIGHTER_API_KEY_INDEX', '3'))
-        self.base_url = os.getenv('LIGHTER_BASE_URL', 'https://testnet.zklighter.elliot.ai')
+        # Lighter credentials were read from environment by _validate_config
         self.is_testnet = self.base_url.find('testnet') != -1
 
-        if not self.private_key:
-            raise ValueError("LIGHTER_PRIVATE_KEY must be set in environment variables")
-
         # Initialize Lighter client using official SDK
         self.signer_client = lighter.SignerClient(
             url=self.base_url,
@@ -48,8 +114,8 @@ class LighterClient(BaseExchangeClient):
         )
 
 
-        # Initialize API client for read operations
-        self.api_client = lighter.ApiClient(configuration=lighter.Configuration(host=self.base_url))
+        # Initialize API client for read operations, reusing the connection pool per host
+        self.api_client = self._get_shared_api_client(self.base_url)
         self.order_api = lighter.OrderApi(self.api_client)
         self.account_api = lighter.AccountApi(self.api_client)
 
@@ -59,12 +125,42 @@ class LighterClient(BaseExchangeClient):
 
         self._order_update_handler = None
         self.ws_client = None
+        # WebSocket account updates are queued and dispatched by a consumer task
+        self._update_q: asyncio.Queue = asyncio.Queue(maxsize=1000)
+        self._drain_task: Optional[asyncio.Task] = None
+        # Track client_order_index (as str) -> market_index for placed orders
+        self._order_index: Dict[str, int] = {}
+        # Unique client_order_index per order, seeded from the clock so restarts don't reuse values
+        self._client_order_indices = itertools.count(int(time.time() * 1000))
+        # In-flight get_active_orders requests keyed by contract_id
+        self._inflight: Dict[str, asyncio.Task] = {}
 
         # Cache market index for contract
         self._market_indices = {}
+        # Reverse lookup of market_id -> symbol
+        self._market_id_to_symbol = {}
         # Cache market details
         self._market_details = {}
+        # Market index and precomputed 10 ** decimals per symbol
+        self._specs: Dict[str, MarketSpec] = {}
         self._markets_loaded = False
+        # Symbols recently confirmed absent -> monotonic time of the miss
+        self._missing_symbols: Dict[str, float] = {}
+        # Pooled HTTP session for REST calls, created lazily on the running loop
+        self._aio_session: Optional[aiohttp.ClientSession] = None
+        self._markets_lock = asyncio.Lock()
+        # Warm start from the on-disk market cache when it is fresh
+        self._load_market_cache()
+
+    @classmethod
+    def _get_shared_api_client(cls, base_url: str) -> Any:
+        """Return the shared lighter.ApiClient for base_url, creating it on first use."""
+        with cls._api_clients_lock:
+            api_client = cls._api_clients.get(base_url)
+            if api_client is None:
+                api_client = lighter.ApiClient(configuration=lighter.Configuration(host=base_url))
+                cls._api_clients[base_url] = api_client
+            return api_client
 
     def check_client(self)-> bool:
         """Check if Lighter client is properly initialized."""
@@ -75,23 +171,32 @@ class LighterClient(BaseExchangeClient):
         return True
 
     def _validate_config(self) -> None:
-        """Validate Lighter configuration."""
-        required_env_vars = ['LIGHTER_PRIVATE_KEY', 'LIGHTER_ACCOUNT_INDEX', 'LIGHTER_API_KEY_INDEX']
-        missing_vars = [var for var in required_env_vars if not os.getenv(var)]
+        """Read and validate Lighter configuration from environment variables."""
+        values = {}
+        missing_vars = []
+        for var, (attr, cast, default) in _ENV_SCHEMA.items():
+            raw = os.environ.get(var) or default
+            if raw is None:
+                missing_vars.append(var)
+                continue
+            try:
+                values[attr] = cast(raw)
+            except ValueError:
+                raise ValueError(f"Invalid value for environment variable {var}: {raw!r}") from None
         if missing_vars:
             raise ValueError(f"Missing required environment variables: {missing_vars}")
-        async def connect(self,orderbook_id:int) -> None:
+
+        for attr, value in values.items():
+            setattr(self, attr, value)
+
+    async def connect(self, orderbook_id: int) -> None:
         """Connect to Lighter WebSocket."""
         try:
-            if self.ws_client is None and self._order_update_handler:
-                self.ws_client = lighter.WsClient(
-                    order_book_ids=[orderbook_id],
-                    account_ids=[str(self.account_index)],
-                    on_account_update=self._handle_account_update
-                )
-            # Start WebSocket connection asynchronously if handler is set
-            if self.ws_client:
-                asyncio.create_task(self.ws_client.run_async())
+            # Subscribe to the shared WebSocket connection if handler is set
+            if self._order_update_handler:
+                if self._drain_task is None or self._drain_task.done():
+                    self._drain_task = asyncio.create_task(self._drain_updates())
+                self.ws_client = await self._subscribe_ws(orderbook_id)
                 await asyncio.sleep(2)  # Wait for connection to establish
         except Exception as e:
             self.logger.log(f"Error connecting to Lighter WebSocket: {e}", "ERROR")
@@ -100,11 +205,113 @@ class LighterClient(BaseExchangeClient):
         """Disconnect from Lighter."""
         try:
             if self.ws_client:
-                # Close WebSocket connection
-                await self.ws_client.close()
+                # Leave the shared WebSocket connection, closing it if we were the last subscriber
                 self.ws_client = None
+                await self._unsubscribe_ws()
         except Exception as e:
             self.logger.log(f"Error during Lighter disconnect: {e}", "ERROR")
+        finally:
+            if self._drain_task:
+                self._drain_task.cancel()
+                self._drain_task = None
+            try:
+                await self.close()
+            except Exception as e:
+                self.logger.log(f"Error closing Lighter HTTP session: {e}", "ERROR")
+
+    async def _subscribe_ws(self, orderbook_id: int) -> Any:
+        """Register on the shared WebSocket for this account, adding orderbook_id if needed."""
+        cls = type(self)
+        key = (self.base_url, self.account_index)
+        async with cls._get_ws_lock():
+            order_book_ids = cls._ws_order_books.get(key, [])
+            ws_client = cls._ws_clients.get(key)
+            task = cls._ws_tasks.get(key)
+            if ws_client is not None and (task is None or task.done()):
+                # WsClient does not reconnect, so a finished run task means the connection is gone
+                await cls._stop_ws(key)
+                ws_client = None
+
+            if ws_client is None or orderbook_id not in order_book_ids:
+                if orderbook_id not in order_book_ids:
+                    order_book_ids = order_book_ids + [orderbook_id]
+                if ws_client is not None:
+                    # WsClient only subscribes on startup, so recreate it with the expanded list
+                    await cls._stop_ws(key)
+
+                ws_client = lighter.WsClient(
+                    order_book_ids=list(order_book_ids),
+                    account_ids=[str(self.account_index)],
+                    on_account_update=lambda *args: cls._dispatch_account_update(key, args[-1])
+                )
+                cls._ws_tasks[key] = asyncio.create_task(ws_client.run_async())
+                cls._ws_clients[key] = ws_client
+                cls._ws_order_books[key] = order_book_ids
+
+            # Only register once the shared client is running, so a failed start leaves no subscriber behind
+            subscribers = cls._ws_subscribers.setdefault(key, [])
+            if self not in subscribers:
+                subscribers.append(self)
+            return ws_client
+
+    async def _unsubscribe_ws(self) -> None:
+        """Remove this client from the shared WebSocket, closing it when unused."""
+        cls = type(self)
+        key = (self.base_url, self.account_index)
+        async with cls._get_ws_lock():
+            subscribers = cls._ws_subscribers.get(key, [])
+            if self in subscribers:
+                subscribers.remove(self)
+            if not subscribers:
+                cls._ws_subscribers.pop(key, None)
+                cls._ws_order_books.pop(key, None)
+                await cls._stop_ws(key)
+
+    @classmethod
+    async def _stop_ws(cls, key: Tuple[str, int]) -> None:
+        """Stop the shared WebSocket client for key by cancelling its run task."""
+        ws_client = cls._ws_clients.pop(key, None)
+        task = cls._ws_tasks.pop(key, None)
+        try:
+            if task is not None:
+                # WsClient has no close(); cancelling run_async tears the connection down
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+        finally:
+            ws = getattr(ws_client, 'ws', None)
+            if ws is not None:
+                result = ws.close()
+                if inspect.isawaitable(result):
+                    await result
+
+    @classmethod
+    def _get_ws_lock(cls) -> asyncio.Lock:
+        """Return the WebSocket registry lock for the running event loop."""
+        loop = asyncio.get_running_loop()
+        lock = cls._ws_locks.get(loop)
+        if lock is None:
+            lock = cls._ws_locks[loop] = asyncio.Lock()
+        return lock
+
+    @classmethod
+    def _dispatch_account_update(cls, key: Tuple[str, int], account_data: dict) -> None:
+        """Fan out an account update to every client subscribed to the shared WebSocket."""
+        for client in list(cls._ws_subscribers.get(key, ())):
+            client._handle_account_update(account_data)
+
+    async def close(self) -> None:
+        """Release pooled HTTP connections."""
+        if self._aio_session is not None and not self._aio_session.closed:
+            await self._aio_session.close()
+        self._aio_session = None
+
+    def _get_aio_session(self) -> aiohttp.ClientSession:
+        """Return the shared aiohttp session, creating it on first use."""
+        if self._aio_session is None or self._aio_session.closed:
+            self._aio_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=8, keepalive_timeout=60)
+            )
+        return self._aio_session
 
     def get_exchange_name(self) -> str:
         """Get the exchange name."""
@@ -118,134 +325,171 @@ class LighterClient(BaseExchangeClient):
         """Handle account update from WebSocket."""
         if self._order_update_handler:
             try:
-                # Convert Lighter account update to standardized format
-                self._order_update_handler(account_data)
-            except Exception as e:
-                self.logger.log(f"Error handling account update: {e}", "ERROR")
+                self._update_q.put_nowait(account_data)
+            except asyncio.QueueFull:
+                self.logger.log("Account update queue full, dropping update", "WARNING")
+
+    async def _drain_updates(self) -> None:
+        """Drain queued account updates and dispatch them to the handler."""
+        while True:
+            batch = [await self._update_q.get()]
+            while not self._update_q.empty():
+                batch.append(self._update_q.get_nowait())
+
+            # Each update is a full account message, so dispatch the batch in order
+            for account_data in batch:
+                try:
+                    # Convert Lighter account update to standardized format
+                    self._order_update_handler(account_data)
+                except Exception as e:
+                    self.logger.log(f"Error handling account update: {e}", "ERROR")
 
 
 # ===== Load Lighter Orderbook Details =====
-    def _load_market_details(self) -> None:
-        """Load market details from Lighter API."""
+    async def _load_market_details(self) -> None:
+        """Load market details from Lighter API.
+
+        Hot-path callers check ``self._markets_loaded`` before awaiting this,
+        so a coroutine is only created while the cache is cold.
+        """
         if self._markets_loaded:
             return
 
+        # Serialize loads so concurrent first callers share a single HTTP request
+        async with self._markets_lock:
+            if self._markets_loaded:
+                return
+            await self._fetch_market_details()
+
+    async def _fetch_market_details(self) -> None:
+        """Fetch market details from Lighter API and populate the caches."""
         try:
             # Use mainnet URL for market details as it has more complete data
             api_url = "https://mainnet.zklighter.elliot.ai/api/v1/orderBookDetails"
 
-            response = requests.get(api_url, timeout=10)
-            response.raise_for_status()
+            timeout = aiohttp.ClientTimeout(total=10)
+            async with self._get_aio_session().get(api_url, timeout=timeout) as response:
+                response.raise_for_status()
+                if ijson is not None:
+                    # Stream-parse the body, keeping only the fields we need per market
+                    markets = [
+                        _market_entry(market)
+                        async for market in ijson.items(response.content, 'order_book_details.item')
+                    ]
+                else:
+                    data = _json_loads(await response.read())
+                    if data.get("code") != 200 or "order_book_details" not in data:
+                        return
+                    markets = [_market_entry(market) for market in data["order_book_details"]]
+
+            if not markets:
+                self.logger.log("Lighter API returned no market details", "ERROR")
+                return
 
-            data = response.json()
+            self._store_markets(markets)
+            self._save_market_cache(markets)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self.logger.log(f"Error fetching market details from Lighter API: {e}", "ERROR")
+        except Exception as e:
+            self.logger.log(f"Unexpected error loading market details: {e}", "ERROR")
 
-            if data.get("code") == 200 and "order_book_details" in data:
-                for market in data["order_book_details"]:
-                    symbol = market.get("symbol")
-                    if symbol:
-                        self._market_details[symbol] = {
-                            "size_decimals": market.get("size_decimals"),
-                            "price_decimals": market.get("price_decimals"),
-                        }
-                        # Also cache the market_id mapping
-                        self._market_indices[symbol] = market.get("market_id")
+    def _store_markets(self, markets: List[Dict[str, Any]]) -> None:
+        """Populate the market caches from a list of market entries."""
+        for market in markets:
+            symbol = market.get("symbol")
+            if symbol:
+                self._market_details[symbol] = {
+                    "size_decimals": market.get("size_decimals"),
+                    "price_decimals": market.get("price_decimals"),
+                }
+                # Also cache the market_id mapping
+                self._market_indices[symbol] = market.get("market_id")
+                self._market_id_to_symbol[market.get("market_id")] = symbol
+                if market.get("size_decimals") is not None and market.get("price_decimals") is not None:
+                    self._specs[symbol] = MarketSpec(
+                        index=market.get("market_id"),
+                        size_scale=10 ** market["size_decimals"],
+                        price_scale=10 ** market["price_decimals"],
+                    )
 
-                self._markets_loaded = True
-            else:
+        self._markets_loaded = True
+
+    def _load_market_cache(self) -> None:
+        """Load market details from the on-disk cache if it is still fresh."""
+        try:
+            if time.time() - os.path.getmtime(MARKET_CACHE_PATH) >= MARKET_CACHE_TTL:
                 return
-        except requests.RequestException as e:
-            self.logger.log(f"Error fetching market details from Lighter API: {e}", "ERROR")
+            with open(MARKET_CACHE_PATH, 'rb') as f:
+                markets = _json_loads(f.read())
+            self._store_markets(markets)
+        except FileNotFoundError:
+            return
         except Exception as e:
-            self.logger.log(f"Unexpected error loading market details: {e}", "ERROR")
+            self.logger.log(f"Error loading cached market details: {e}", "WARNING")
+
+    def _save_market_cache(self, markets: List[Dict[str, Any]]) -> None:
+        """Atomically write market details to the on-disk cache."""
+        try:
+            cache_dir = os.path.dirname(MARKET_CACHE_PATH)
+            os.makedirs(cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(_json_dumps(markets))
+                os.replace(tmp_path, MARKET_CACHE_PATH)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except Exception as e:
+            self.logger.log(f"Error saving market details cache: {e}", "WARNING")
 
-    def symbol_to_orderbook_id(self, symbol: str) -> int:
+    async def symbol_to_orderbook_id(self, symbol: str) -> int:
         """Convert symbol to Lighter orderbook ID."""
         # Load market details if not already loaded
-        self._load_market_details()
+        if not self._markets_loaded:
+            await self._load_market_details()
 
         # Check if symbol exists in our cache
         if symbol in self._market_indices:
             return self._market_indices[symbol]
 
-        # If not found, try to reload market details once more
-        if self._markets_loaded:
-            self._markets_loaded = False
-            self._load_market_details()
+        # If not found, try to reload market details once more, unless the symbol
+        # was already confirmed missing within the negative cache TTL
+        if time.monotonic() - self._missing_symbols.get(symbol, float('-inf')) >= MISSING_SYMBOL_TTL:
+            if self._markets_loaded:
+                self._markets_loaded = False
+                await self._load_market_details()
 
-        if symbol in self._market_indices:
-            return self._market_indices[symbol]
-        else:
-            self.logger.log(f"Symbol {symbol} not found in Lighter market details", "ERROR")
-            raise ValueError(f"Symbol {symbol} not found in Lighter market details")
+            if symbol in self._market_indices:
+                return self._market_indices[symbol]
+            self._missing_symbols[symbol] = time.monotonic()
+
+        self.logger.log(f"Symbol {symbol} not found in Lighter market details", "ERROR")
+        raise ValueError(f"Symbol {symbol} not found in Lighter market details")
     
-    def get_market_details(self, symbol: str) -> Optional[Dict[str, Any]]:
+    async def _resolve_market(self, symbol: str) -> MarketSpec:
+        """Resolve the market index and scale factors for a symbol."""
+        spec = self._specs.get(symbol)
+        if spec is None:
+            # Loads (or reloads) market details, raising if the symbol is unknown
+            await self.symbol_to_orderbook_id(symbol)
+            spec = self._specs.get(symbol)
+            if spec is None:
+                raise ValueError(f"Market details not found for symbol: {symbol}")
+        return spec
+
+    async def get_market_details(self, symbol: str) -> Optional[Dict[str, Any]]:
         """Get market details for a symbol."""
-        self._load_market_details()
+        if not self._markets_loaded:
+            await self._load_market_details()
         return self._market_details.get(symbol)
 
-    def _get_symbol_from_market_id(self, market_id: int) -> Optional[str]:
+    async def _get_symbol_from_market_id(self, market_id: int) -> Optional[str]:
         """Get symbol from market ID."""
-        self._load_market_details()
-        for symbol, details in self._market_indices.items():
-            if details == market_id:
-                return symbol
-        return None
-
-    def _convert_from_lighter_amount_with_market_id(self, amount: str, market_id: int) -> Decimal:
-        """Convert Lighter amount using market_id."""
-        symbol = self._get_symbol_from_market_id(market_id)
-        if symbol:
-            return self._convert_from_lighter_amount(amount, symbol)
-        # Fallback to default precision
-        return Decimal(amount) / 10000
-
-    def _convert_from_lighter_price_with_market_id(self, price: str, market_id: int) -> Decimal:
-        """Convert Lighter price using market_id."""
-        symbol = self._get_symbol_from_market_id(market_id)
-        if symbol:
-            return self._convert_from_lighter_price(price, symbol)
-        # Fallback to default precision
-        return Decimal(price) / 100
-    
-    def _convert_amount_to_base(self, amount: Decimal, symbol: str) -> int:
-        """Convert decimal amount to base units for Lighter using market details."""
-        market_details = self.get_market_details(symbol)
-        if market_details and market_details.get("size_decimals") is not None:
-            decimals = market_details["size_decimals"]
-            return int(amount * (10 ** decimals))
-        else:
-            raise ValueError(f"Market details not found for symbol: {symbol}")
-
-    def _convert_price_to_lighter(self, price: Decimal, symbol: str) -> int:
-        """Convert decimal price to Lighter price units using market details."""
-        market_details = self.get_market_details(symbol)
-        if market_details and market_details.get("price_decimals") is not None:
-            decimals = market_details["price_decimals"]
-            return int(price * (10 ** decimals))
-
-        else:
-            raise ValueError(f"Market details not found for symbol: {symbol}")
-
-    def _convert_from_lighter_amount(self, amount: str, symbol: str) -> Decimal:
-        """Convert Lighter amount string to Decimal using market details."""
-        market_details = self.get_market_details(symbol)
-        if market_details and market_details.get("size_decimals") is not None:
-            decimals = market_details["size_decimals"]
-            return Decimal(amount) * (10 ** decimals)
-        else:
-            raise ValueError(f"Market details not found for symbol: {symbol}")
-        
-
-    def _convert_from_lighter_price(self, price: str, symbol: str) -> Decimal:
-        """Convert Lighter price string to Decimal using market details."""
-        market_details = self.get_market_details(symbol)
-        if market_details and market_details.get("price_decimals") is not None:
-            decimals = market_details["price_decimals"]
-            return Decimal(price) * (10 ** decimals)
+        if not self._markets_loaded:
+            await self._load_market_details()
+        return self._market_id_to_symbol.get(market_id)
 
-        else:
-            raise ValueError(f"Market details not found for symbol: {symbol}")
-    
 #================== 
 
     @query_retry(default_return=(0, 0))
@@ -267,33 +511,54 @@ class LighterClient(BaseExchangeClient):
         best_ask = Decimal(asks[0]['price']) if asks and len(asks) > 0 else 0
         return best_bid, best_ask
     
+    async def _create_limit_order(self, spec: MarketSpec, client_order_index: int, amount_base: int,
+                                  price: int, is_ask: bool) -> Tuple[Any, Any]:
+        """Submit a good-till-time limit order through the signer client."""
+        _, tx_hash, err = await self.signer_client.create_order(
+            market_index=spec.index,
+            client_order_index=client_order_index,
+            base_amount=amount_base,
+            price=price,
+            is_ask=is_ask,
+            order_type=lighter.SignerClient.ORDER_TYPE_LIMIT,
+            time_in_force=lighter.SignerClient.ORDER_TIME_IN_FORCE_GOOD_TILL_TIME,
+            reduce_only=0,
+            trigger_price=0,
+        )
+        return tx_hash, err
+
+    def _remember_order_market(self, order_id: str, market_index: int) -> None:
+        """Record the market of a placed order, evicting the oldest entries past the limit."""
+        self._order_index[order_id] = market_index
+        while len(self._order_index) > ORDER_INDEX_LIMIT:
+            del self._order_index[next(iter(self._order_index))]
+
     @query_retry(default_return=OrderResult(success=False, error_message="Query failed"))
     async def place_open_order(self, contract_id: str, quantity: Decimal, direction: str) -> OrderResult:
         """Place an open order on Lighter."""
         try:
-            market_index = self.symbol_to_orderbook_id(contract_id)
-            amount_base = self._convert_amount_to_base(quantity, contract_id)
+            spec = await self._resolve_market(contract_id)
+            market_index = spec.index
+            amount_base = int(quantity * spec.size_scale)
             is_ask = direction.lower() == 'sell'
 
             # Place limit order for opening position
-            _, tx_hash, err = self.signer_client.create_order(
-                market_index=market_index,
-                client_order_index=123,
-                base_amount=amount_base,
-                price=405000,
-                is_ask=is_ask,
-                order_type=lighter.SignerClient.ORDER_TYPE_LIMIT,
-                time_in_force=lighter.SignerClient.ORDER_TIME_IN_FORCE_GOOD_TILL_TIME,
-                reduce_only=0,
-                trigger_price=0,
-    )
-                
+            client_order_index = next(self._client_order_indices)
+            tx_hash, err = await self._create_limit_order(
+                spec, client_order_index, amount_base, 405000, is_ask
+            )
+
             if err:
                 return OrderResult(success=False, error_message=str(err))
 
+            # Identify the order by its client_order_index, which the order API echoes back,
+            # and remember its market so lookups can be filtered server-side
+            order_id = str(client_order_index)
+            self._remember_order_market(order_id, market_index)
+
             return OrderResult(
                 success=True,
-                order_id=tx_hash,
+                order_id=order_id,
                 side=direction,
                 size=quantity,
                 status='pending'
@@ -307,26 +572,29 @@ class LighterClient(BaseExchangeClient):
     async def place_close_order(self, contract_id: str, quantity: Decimal, price: Decimal, side: str) -> OrderResult:
         """Place a close order on Lighter."""
         try:
-            market_index = self.symbol_to_orderbook_id(contract_id)
-            amount_base = self._convert_amount_to_base(quantity, contract_id)
-            lighter_price = self._convert_price_to_lighter(price, contract_id)
+            spec = await self._resolve_market(contract_id)
+            market_index = spec.index
+            amount_base = int(quantity * spec.size_scale)
+            lighter_price = int(price * spec.price_scale)
             is_ask = side.lower() == 'sell'
 
             # Place limit order for closing position
-            _, tx_hash, err = await self.signer_client.create_order(
-                market_index=market_index,
-                amount_base=amount_base,
-                price=lighter_price,
-                is_ask=is_ask,
-                order_type="limit"
+            client_order_index = next(self._client_order_indices)
+            tx_hash, err = await self._create_limit_order(
+                spec, client_order_index, amount_base, lighter_price, is_ask
             )
 
             if err:
                 return OrderResult(success=False, error_message=str(err))
 
+            # Identify the order by its client_order_index, which the order API echoes back,
+            # and remember its market so lookups can be filtered server-side
+            order_id = str(client_order_index)
+            self._remember_order_market(order_id, market_index)
+
             return OrderResult(
                 success=True,
-                order_id=tx_hash,
+                order_id=order_id,
                 side=side,
                 size=quantity,
                 price=price,
@@ -361,35 +629,53 @@ class LighterClient(BaseExchangeClient):
     async def get_order_info(self, order_id: str) -> Optional[OrderInfo]:
         """Get order information from Lighter."""
         try:
-            # Get active orders and search for the specific order
-            active_orders = await self.order_api.account_active_orders(
-                account_index=self.account_index
-            )
+            order_id = str(order_id)
+
+            # Get active orders, narrowed to the order's market when it is known
+            market_index = self._order_index.get(order_id)
+            if market_index is not None:
+                active_orders = await self.order_api.account_active_orders(
+                    account_index=self.account_index,
+                    market_index=market_index
+                )
+            else:
+                active_orders = await self.order_api.account_active_orders(
+                    account_index=self.account_index
+                )
 
-            for order in active_orders:
-                if str(order.order_id) == order_id:
-                    # Try to get market_index from order, fallback to using default conversion
-                    market_id = getattr(order, 'market_index', None) or getattr(order, 'market_id', None)
-                    if market_id is not None:
-                        size = self._convert_from_lighter_amount_with_market_id(order.amount_base, market_id)
-                        price = self._convert_from_lighter_price_with_market_id(order.price, market_id)
-                        remaining_size = self._convert_from_lighter_amount_with_market_id(order.amount_base, market_id)
-                    else:
-                        # Fallback to default conversion
-                        size = Decimal(order.amount_base) / 10000
-                        price = Decimal(order.price) / 100
-                        remaining_size = Decimal(order.amount_base) / 10000
-
-                    return OrderInfo(
-                        order_id=str(order.order_id),
-                        side='sell' if order.is_ask else 'buy',
-                        size=size,
-                        price=price,
-                        status=order.status,
-                        filled_size=Decimal('0'),  # Would need to calculate from order data
-                        remaining_size=remaining_size
-                    )
+            if market_index is not None:
+                # Orders placed by this client are identified by their client_order_index
+                orders_by_id = {str(order.client_order_index): order for order in active_orders}
+            else:
+                orders_by_id = {str(order.order_id): order for order in active_orders}
+            order = orders_by_id.get(order_id)
+            if order is not None:
+                # Stop tracking the market once the order has reached a final state
+                if str(order.status).lower().startswith(('filled', 'canceled', 'cancelled')):
+                    self._order_index.pop(order_id, None)
+
+                # Try to get market_index from order, fallback to using default conversion
+                market_id = getattr(order, 'market_index', None) or getattr(order, 'market_id', None)
+                if market_id is None:
+                    market_id = market_index
+                spec = None
+                if market_id is not None:
+                    spec = self._specs.get(await self._get_symbol_from_market_id(market_id))
+                # Fallback to default precision when the market is unknown
+                size_scale, price_scale = (spec.size_scale, spec.price_scale) if spec else (10000, 100)
+                size = Decimal(order.amount_base) / size_scale
+
+                return OrderInfo(
+                    order_id=order_id,
+                    side='sell' if order.is_ask else 'buy',
+                    size=size,
+                    price=Decimal(order.price) / price_scale,
+                    status=order.status,
+                    filled_size=_DEC_ZERO,  # Would need to calculate from order data
+                    remaining_size=size
+                )
 
+            # A just-placed order may not be listed yet, so keep tracking it on a miss
             return None
 
         except Exception as e:
@@ -399,40 +685,45 @@ class LighterClient(BaseExchangeClient):
     @query_retry(default_return=[])
     async def get_active_orders(self, contract_id: str) -> List[OrderInfo]:
         """Get active orders for a contract on Lighter."""
+        # Concurrent callers for the same contract share one in-flight request
+        task = self._inflight.get(contract_id)
+        if task is None:
+            task = asyncio.create_task(self._fetch_active_orders(contract_id))
+            self._inflight[contract_id] = task
+            task.add_done_callback(lambda _: self._inflight.pop(contract_id, None))
+        return list(await asyncio.shield(task))
+
+    async def _fetch_active_orders(self, contract_id: str) -> List[OrderInfo]:
+        """Fetch active orders for a contract from the Lighter API."""
         try:
-            market_index = self.symbol_to_orderbook_id(contract_id)
+            spec = await self._resolve_market(contract_id)
 
             # Get active orders for the account
             active_orders = await self.order_api.account_active_orders(
                 account_index=self.account_index,
-                market_index=market_index
+                market_index=spec.index
             )
 
-            order_list = []
-            for order in active_orders:
-                # Since we're filtering by market_index, we can use contract_id for conversion
-                size = self._convert_from_lighter_amount(order.amount_base, contract_id)
-                price = self._convert_from_lighter_price(order.price, contract_id)
-                remaining_size = self._convert_from_lighter_amount(order.amount_base, contract_id)
-
-                order_info = OrderInfo(
+            # Since we're filtering by market_index, every order shares the contract's scales
+            size_scale, price_scale = spec.size_scale, spec.price_scale
+            return [
+                OrderInfo(
                     order_id=str(order.order_id),
                     side='sell' if order.is_ask else 'buy',
-                    size=size,
-                    price=price,
+                    size=(size := Decimal(order.amount_base) / size_scale),
+                    price=Decimal(order.price) / price_scale,
                     status=order.status,
-                    filled_size=Decimal('0'),  # Would need to calculate from order data
-                    remaining_size=remaining_size
+                    filled_size=_DEC_ZERO,  # Would need to calculate from order data
+                    remaining_size=size
                 )
-                order_list.append(order_info)
-
-            return order_list
+                for order in active_orders
+            ]
 
         except Exception as e:
             self.logger.log(f"Error getting active orders: {e}", "ERROR")
             return []
 
-    @query_retry(default_return=Decimal('0'))
+    @query_retry(default_return=_DEC_ZERO)
     async def get_account_positions(self) -> Decimal:
         """Get account positions from Lighter."""
         try:
@@ -441,18 +732,18 @@ class LighterClient(BaseExchangeClient):
                 account_index=self.account_index
             )
 
-            total_position_value = Decimal('0')
+            total_position_value = _DEC_ZERO
 
             if positions:
                 for position in positions:
-                    position_value = Decimal(position.position_value) if position.position_value else Decimal('0')
+                    position_value = Decimal(position.position_value) if position.position_value else _DEC_ZERO
                     total_position_value += position_value
 
             return total_position_value
 
         except Exception as e:
             self.logger.log(f"Error getting account positions: {e}", "ERROR")
-            return Decimal('0')
+            return _DEC_ZERO
         
         
         
@@ -5,6 +5,7 @@ Modular Trading Bot - Supports multiple exchanges
 
 import argparse
 import asyncio
+import os
 from pathlib import Path
 import sys
 import dotenv
@@ -44,15 +45,20 @@ def parse_arguments():
     return parser.parse_args()
 
 
-async def main():
-    """Main entry point."""
-    args = parse_arguments()
-    env_path = Path(args.env_file)
-    if not env_path.exists():
-        print(f"Env file not find: {env_path.resolve()}")
-        sys.exit(1)
-    dotenv.load_dotenv(args.env_file)
+def setup_event_loop_policy():
+    """Use uvloop as the event loop when USE_UVLOOP=1 and it is installed."""
+    if os.getenv('USE_UVLOOP') != '1':
+        return
+    try:
+        import uvloop
+    except ImportError:
+        print("USE_UVLOOP is set but uvloop is not installed, using the default event loop")
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
+
+async def main(args):
+    """Main entry point."""
     # Create configuration
     config = TradingConfig(
         ticker=args.ticker,
@@ -78,4 +84,12 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    args = parse_arguments()
+    env_path = Path(args.env_file)
+    if not env_path.exists():
+        print(f"Env file not find: {env_path.resolve()}")
+        sys.exit(1)
+    dotenv.load_dotenv(args.env_file)
+
+    setup_event_loop_policy()
+    asyncio.run(main(args))
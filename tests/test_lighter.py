@@ -0,0 +1,282 @@
+import sys
+import types
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import asyncio
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+
+
+# The lighter and edgex SDKs are git dependencies; stub the parts the clients touch
+class _StubSignerClient:
+    ORDER_TYPE_LIMIT = 0
+    ORDER_TIME_IN_FORCE_GOOD_TILL_TIME = 1
+
+    def __init__(self, **kwargs):
+        self.orders = []
+
+    async def create_order(self, **kwargs):
+        self.orders.append(kwargs)
+        return None, SimpleNamespace(tx_hash='0xabc'), None
+
+
+class _StubOrderApi:
+    def __init__(self, api_client):
+        self.orders = []
+        self.calls = []
+
+    async def account_active_orders(self, **kwargs):
+        self.calls.append(kwargs)
+        await asyncio.sleep(0)
+        return self.orders
+
+
+_lighter = types.ModuleType('lighter')
+_lighter.SignerClient = _StubSignerClient
+_lighter.ApiClient = lambda configuration=None: object()
+_lighter.Configuration = lambda host=None: None
+_lighter.OrderApi = _StubOrderApi
+_lighter.AccountApi = lambda api_client: None
+_lighter.WsClient = None  # replaced per test by _StubWsClient
+sys.modules['lighter'] = _lighter
+
+_edgex_sdk = types.ModuleType('edgex_sdk')
+for _name in ['Client', 'OrderSide', 'WebSocketManager', 'CancelOrderParams',
+              'GetOrderBookDepthParams', 'GetActiveOrderParams']:
+    setattr(_edgex_sdk, _name, type(_name, (), {}))
+sys.modules.setdefault('edgex_sdk', _edgex_sdk)
+
+import exchanges.lighter as lighter_module  # noqa: E402
+from exchanges.lighter import LighterClient  # noqa: E402
+
+lighter_module.lighter = _lighter
+
+ETH_MARKET = {"symbol": "ETH", "market_id": 0, "size_decimals": 4, "price_decimals": 2}
+
+
+class _StubLogger:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def log(self, message, level="INFO"):
+        pass
+
+
+@pytest.fixture
+def client(monkeypatch, tmp_path):
+    monkeypatch.setenv('LIGHTER_PRIVATE_KEY', 'key')
+    monkeypatch.setenv('LIGHTER_ACCOUNT_INDEX', '1')
+    monkeypatch.setenv('LIGHTER_API_KEY_INDEX', '2')
+    monkeypatch.setattr(lighter_module, 'TradingLogger', _StubLogger)
+    monkeypatch.setattr(lighter_module, 'MARKET_CACHE_PATH', str(tmp_path / 'markets.json'))
+    return LighterClient(SimpleNamespace(ticker='ETH'))
+
+
+class _StubWsClient:
+    """Mirrors lighter.WsClient: subscribes on startup, no close(), no reconnect."""
+    instances = []
+
+    def __init__(self, order_book_ids, account_ids, on_account_update):
+        self.order_book_ids = order_book_ids
+        self.on_account_update = on_account_update
+        self.ws = None
+        self.dropped = asyncio.Event()
+        self.cancelled = False
+        _StubWsClient.instances.append(self)
+
+    async def run_async(self):
+        try:
+            await self.dropped.wait()
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+
+
+@pytest.fixture
+def ws_stub(monkeypatch):
+    _StubWsClient.instances = []
+    monkeypatch.setattr(_lighter, 'WsClient', _StubWsClient)
+    yield _StubWsClient
+    for registry in (LighterClient._ws_clients, LighterClient._ws_tasks,
+                     LighterClient._ws_order_books, LighterClient._ws_subscribers):
+        registry.clear()
+
+
+def _order(order_id, amount_base='12345', price='310012', is_ask=False, client_order_index=0, status='open'):
+    return SimpleNamespace(order_id=order_id, client_order_index=client_order_index, amount_base=amount_base,
+                           price=price, is_ask=is_ask, status=status, market_index=0)
+
+
+def test_active_orders_convert_from_base_units(client):
+    client._store_markets([ETH_MARKET])
+    client.order_api.orders = [_order(7)]
+
+    orders = asyncio.run(client.get_active_orders('ETH'))
+
+    assert orders[0].size == Decimal('1.2345')
+    assert orders[0].remaining_size == Decimal('1.2345')
+    assert orders[0].price == Decimal('3100.12')
+
+
+def test_order_info_converts_from_base_units(client):
+    client._store_markets([ETH_MARKET])
+    client.order_api.orders = [_order(7, is_ask=True)]
+
+    info = asyncio.run(client.get_order_info('7'))
+
+    assert info.size == Decimal('1.2345')
+    assert info.price == Decimal('3100.12')
+    assert info.side == 'sell'
+
+
+def test_order_info_for_placed_order_filters_by_market(client):
+    client._store_markets([ETH_MARKET])
+    result = asyncio.run(client.place_close_order('ETH', Decimal('1.2345'), Decimal('3100.12'), 'sell'))
+    client_order_index = client.signer_client.orders[0]['client_order_index']
+    assert result.order_id == str(client_order_index)
+
+    # Not listed yet: the order stays tracked
+    assert asyncio.run(client.get_order_info(result.order_id)) is None
+    assert client.order_api.calls[-1] == {'account_index': 1, 'market_index': 0}
+    assert result.order_id in client._order_index
+
+    client.order_api.orders = [_order(99, client_order_index=client_order_index, is_ask=True)]
+    info = asyncio.run(client.get_order_info(result.order_id))
+    assert info.order_id == result.order_id
+    assert info.size == Decimal('1.2345')
+    assert client.order_api.calls[-1]['market_index'] == 0
+    assert result.order_id in client._order_index
+
+    client.order_api.orders = [_order(99, client_order_index=client_order_index, status='filled')]
+    asyncio.run(client.get_order_info(result.order_id))
+    assert result.order_id not in client._order_index
+
+
+def test_missing_symbol_is_negative_cached(client, monkeypatch):
+    fetches = []
+
+    async def fetch():
+        fetches.append(1)
+        client._store_markets([ETH_MARKET])
+
+    now = [1000.0]
+    monkeypatch.setattr(client, '_fetch_market_details', fetch)
+    monkeypatch.setattr(lighter_module.time, 'monotonic', lambda: now[0])
+
+    async def lookup(symbol='NOPE'):
+        with pytest.raises(ValueError):
+            await client.symbol_to_orderbook_id(symbol)
+
+    asyncio.run(lookup())
+    asyncio.run(lookup())
+    assert len(fetches) == 2  # initial load plus one reload for the miss
+
+    now[0] += lighter_module.MISSING_SYMBOL_TTL
+    asyncio.run(lookup())
+    assert len(fetches) == 3
+
+    # Alternating unknown symbols each reload once, then stay negative-cached
+    for symbol in ['X', 'Y', 'X', 'Y', 'X']:
+        asyncio.run(lookup(symbol))
+    assert len(fetches) == 5
+    assert asyncio.run(client.symbol_to_orderbook_id('ETH')) == 0
+
+
+def test_concurrent_active_order_queries_share_one_request(client):
+    client._store_markets([ETH_MARKET])
+    client.order_api.orders = [_order(7)]
+
+    async def burst():
+        return await asyncio.gather(*[client.get_active_orders('ETH') for _ in range(5)])
+
+    results = asyncio.run(burst())
+
+    assert len(client.order_api.calls) == 1
+    assert all(len(orders) == 1 for orders in results)
+    assert results[0] is not results[1]
+    assert not client._inflight
+
+    asyncio.run(client.get_active_orders('ETH'))
+    assert len(client.order_api.calls) == 2
+
+
+def test_market_cache_warm_start(client, monkeypatch):
+    client._save_market_cache([ETH_MARKET])
+
+    warm = LighterClient(SimpleNamespace(ticker='ETH'))
+    assert warm._markets_loaded
+    assert warm._specs['ETH'].size_scale == 10 ** 4
+    assert asyncio.run(warm.symbol_to_orderbook_id('ETH')) == 0
+
+    monkeypatch.setattr(lighter_module, 'MARKET_CACHE_TTL', 0)
+    cold = LighterClient(SimpleNamespace(ticker='ETH'))
+    assert not cold._markets_loaded
+
+
+def _ws_client_pair(client):
+    other = LighterClient(SimpleNamespace(ticker='ETH'))
+    for c in (client, other):
+        c.setup_order_update_handler(lambda update: None)
+    return client, other
+
+
+def test_ws_connection_is_shared_and_recreated_for_new_orderbook(client, ws_stub):
+    a, b = _ws_client_pair(client)
+
+    async def scenario():
+        a.ws_client = await a._subscribe_ws(0)
+        b.ws_client = await b._subscribe_ws(0)
+        await asyncio.sleep(0)  # let the run task start
+        assert a.ws_client is b.ws_client
+        assert len(ws_stub.instances) == 1
+
+        first = a.ws_client
+        b.ws_client = await b._subscribe_ws(1)
+        await asyncio.sleep(0)
+        assert first.cancelled
+        assert b.ws_client.order_book_ids == [0, 1]
+        assert len(ws_stub.instances) == 2
+
+        a.ws_client = b.ws_client
+        b.ws_client.on_account_update('1', {'account': 1})
+        assert a._update_q.qsize() == b._update_q.qsize() == 1
+
+        await a.disconnect()
+        assert not b.ws_client.cancelled
+        shared = b.ws_client
+        await b.disconnect()
+        assert shared.cancelled
+        assert not LighterClient._ws_clients and not LighterClient._ws_subscribers
+
+    asyncio.run(scenario())
+
+
+def test_ws_restarts_after_run_task_ends(client, ws_stub):
+    async def scenario():
+        dead = await client._subscribe_ws(0)
+        dead.dropped.set()
+        await asyncio.sleep(0)
+
+        alive = await client._subscribe_ws(0)
+        assert alive is not dead
+        assert not LighterClient._ws_tasks[(client.base_url, client.account_index)].done()
+
+    asyncio.run(scenario())
+
+
+def test_ws_failed_start_does_not_register_subscriber(client, ws_stub, monkeypatch):
+    def broken(**kwargs):
+        raise RuntimeError('boom')
+
+    monkeypatch.setattr(_lighter, 'WsClient', broken)
+
+    async def scenario():
+        with pytest.raises(RuntimeError):
+            await client._subscribe_ws(0)
+
+    asyncio.run(scenario())
+    assert not LighterClient._ws_subscribers
+    assert not LighterClient._ws_order_books